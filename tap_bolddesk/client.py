@@ -1,87 +1,181 @@
 """REST client handling, including BoldDeskStream base class."""
 
-import requests
 import logging
-from pathlib import Path
-from typing import Any, Dict, Optional, Union, List, Iterable
-
-from memoization import cached
-
-from singer_sdk.helpers.jsonpath import extract_jsonpath
-from singer_sdk.streams import RESTStream
+import math
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Optional
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
 from singer_sdk.authenticators import APIKeyAuthenticator
+from singer_sdk.streams import RESTStream
 
-
-SCHEMAS_DIR = Path(__file__).parent / Path("./schemas")
+_PAGE_SIZE = 100
+# Query parameters sent with every ticket page request.
+_BASE_TICKET_PARAMS = MappingProxyType(
+    {
+        "PerPage": _PAGE_SIZE,
+        "RequiresCounts": True,
+        "sort": "asc",
+        "OrderBy": "ticketId",
+    }
+)
 
 
 class BoldDeskStream(RESTStream):
     """BoldDesk stream class."""
 
+    # Shared sessions, keyed by connection pool size.
+    _SESSIONS: Dict[int, requests.Session] = {}
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the stream and resolve config-derived values once."""
+        super().__init__(*args, **kwargs)
+        self._url_base = self.config.get("api_url")
+        self._authenticator = APIKeyAuthenticator.create_for_stream(
+            self,
+            key="x-api-key",
+            value=self.config.get("api_key"),
+            location="header"
+        )
+        self._base_headers: dict = {}
+        if "user_agent" in self.config:
+            self._base_headers["User-Agent"] = self.config.get("user_agent")
+        # Unset or null falls back to the default, anything below 1 is clamped.
+        max_parallel_requests = self.config.get("max_parallel_requests")
+        self._max_parallel_requests = (
+            8 if max_parallel_requests is None else max(1, max_parallel_requests)
+        )
+        self._url_params = dict(_BASE_TICKET_PARAMS)
+        start_date = self.config.get("start_date")
+        if start_date:
+            self._url_params["Q"] = f'createdon:{{"from":"{start_date}"}}'
+
     @property
     def url_base(self) -> str:
         """Return the API URL root, configurable via tap settings."""
-        return self.config.get("api_url")
+        return self._url_base
     
-    records_jsonpath = "$.result[*]"  # Or override `parse_response`.
-    total_count_path = "$.count" 
+    page_size = _PAGE_SIZE
 
     @property
     def authenticator(self) -> APIKeyAuthenticator:
-        """Return a new authenticator object."""
-        return APIKeyAuthenticator.create_for_stream(
-            self,
-            key="x-api-key",
-            value=self.config.get("api_key"),
-            location="header"
-        )
+        """Return the authenticator object shared by all requests."""
+        return self._authenticator
+
+    @property
+    def requests_session(self) -> requests.Session:
+        """Return the session shared by all BoldDesk streams.
+
+        Sharing one pooled session lets every stream reuse the open keep-alive
+        connections to the BoldDesk host instead of doing a new TLS handshake.
+        Sessions are deliberately process-wide and kept per pool size, so the
+        per-stream session created by `RESTStream.__init__` is left unused.
+        """
+        pool_size = self._max_parallel_requests
+        session = BoldDeskStream._SESSIONS.get(pool_size)
+        if session is None:
+            session = requests.Session()
+            # All streams talk to one host, so a single pool is enough. It
+            # holds one connection per concurrent page request.
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=pool_size,
+                max_retries=0,
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            BoldDeskStream._SESSIONS[pool_size] = session
+        return session
 
     @property
     def http_headers(self) -> dict:
         """Return the http headers needed."""
-        headers = {}
-        if "user_agent" in self.config:
-            headers["User-Agent"] = self.config.get("user_agent")
-        # If not using an authenticator, you may also provide inline auth headers:
-        # headers["Private-Token"] = self.config.get("auth_token")
-        return headers
-
-    def get_next_page_token(
-        self, response: requests.Response, previous_token: Optional[Any]
-    ) -> Optional[Any]:
-        """Return a token for identifying next page or None if no more pages."""
-        next_page_token = 2
-        if previous_token is None:
-            logging.info("Requesting the 2nd page now.")
-        else :
-            if previous_token < int(response.json().get("count", 0)) / 100:
-                next_page_token = int(previous_token) + 1
-            else :
-                next_page_token = None
-
-        logging.info("Next requesting page: " + str(next_page_token))
-
-        return next_page_token
+        # Return a copy, the SDK adds the auth headers to it per request.
+        return dict(self._base_headers)
+
+    def request_records(self, context: Optional[dict]) -> Iterable[dict]:
+        """Request all pages, fetching the pages after the first concurrently.
+
+        BoldDesk returns the total record count with the first page, so all
+        remaining pages are known upfront and need not be requested one by one.
+        """
+        decorated_request = self.request_decorator(self._request)
+
+        def request_page(page: Optional[int]) -> requests.Response:
+            prepared_request = self.prepare_request(context, next_page_token=page)
+            return decorated_request(prepared_request, context)
+
+        first_page = request_page(None)
+        yield from self.parse_response(first_page)
+
+        count = int(self._get_json(first_page).get("count", 0))
+        last_page = math.ceil(count / self.page_size)
+        if last_page < 2:
+            return
+
+        logging.info("Requesting pages 2 to %d.", last_page)
+        max_workers = self._max_parallel_requests
+        pages = iter(range(2, last_page + 1))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Keep at most `max_workers` pages in flight, so pages are not
+            # buffered faster than records are consumed downstream.
+            pending = deque(
+                executor.submit(request_page, page)
+                for page in islice(pages, max_workers)
+            )
+            while pending:
+                response = pending.popleft().result()
+                for page in islice(pages, 1):
+                    pending.append(executor.submit(request_page, page))
+                yield from self.parse_response(response)
 
     def get_url_params(
         self, context: Optional[dict], next_page_token: Optional[Any]
     ) -> Dict[str, Any]:
         """Return a dictionary of values to be used in URL parameterization."""
-        params: dict = { }
-        params["PerPage"] = 100
-        params["RequiresCounts"] = True
-        params["sort"] = "asc"
-        params["OrderBy"] = "ticketId"
+        params: dict = dict(self._url_params)
         if next_page_token:
             params["Page"] = next_page_token
-        if self.config.get("start_date"):
-            params["Q"] = "createdon:{\"from\":\"" + self.config.get("start_date") + "\"}"
         return params
 
     def parse_response(self, response: requests.Response) -> Iterable[dict]:
         """Parse the response and return an iterator of result rows."""
-        # TODO: Parse response body and return a set of records.
-        yield from extract_jsonpath(self.records_jsonpath, input=response.json())
+        # Records are a top-level array, so return it directly instead of
+        # evaluating a JSONPath expression or wrapping it in a generator.
+        return self._get_json(response).get("result") or ()
+
+    def _get_json(self, response: requests.Response) -> dict:
+        """Return the parsed response body, parsing it only once per response."""
+        if "_bolddesk_json" not in response.__dict__:
+            response.__dict__["_bolddesk_json"] = orjson.loads(response.content)
+        return response.__dict__["_bolddesk_json"]
+
+    def _write_record_message(self, record: dict) -> None:
+        """Write out RECORD messages, serialized with orjson."""
+        try:
+            lines = [
+                orjson.dumps(record_message.asdict()) + b"\n"
+                for record_message in self._generate_record_messages(record)
+            ]
+        except TypeError:
+            # Values orjson cannot encode (e.g. Decimal) use the SDK writer.
+            # Nothing was written yet, so the record is not emitted twice.
+            super()._write_record_message(record)
+            return
+        # orjson emits UTF-8 bytes, write them without re-encoding.
+        stdout_buffer = getattr(sys.stdout, "buffer", None)
+        for line in lines:
+            if stdout_buffer is not None:
+                stdout_buffer.write(line)
+            else:
+                sys.stdout.write(line.decode())
+            sys.stdout.flush()
 
     def post_process(self, row: dict, context: Optional[dict]) -> dict:
         """As needed, append or transform raw data to match expected structure."""
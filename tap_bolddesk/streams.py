@@ -1,8 +1,5 @@
 """Stream type classes for tap-bolddesk."""
 
-from pathlib import Path
-from typing import Any, Dict, Optional, Union, List, Iterable
-
 from singer_sdk import typing as th  # JSON Schema typing helpers
 
 from tap_bolddesk.client import BoldDeskStream
@@ -10,6 +7,28 @@ from tap_bolddesk.client import BoldDeskStream
 # TODO: Delete this is if not using json files for schema definition
 # SCHEMAS_DIR = Path(__file__).parent / Path("./schemas")
 
+# Object shapes shared by several ticket properties
+_ID_NAME_OBJECT = th.ObjectType(
+    th.Property(
+        "id",
+        th.IntegerType
+    ),
+    th.Property(
+        "name",
+        th.StringType
+    )
+)
+_ID_DESCRIPTION_OBJECT = th.ObjectType(
+    th.Property(
+        "id",
+        th.IntegerType
+    ),
+    th.Property(
+        "description",
+        th.StringType
+    )
+)
+
 class TicketsStream(BoldDeskStream):
     """Define custom stream."""
     name = "tickets"
@@ -56,70 +75,10 @@ class TicketsStream(BoldDeskStream):
             description="Count of how often an SLA was achieved for this ticket"
         ),
         th.Property("createdOn", th.StringType),
-        th.Property(
-            "group",
-            th.ObjectType(
-                th.Property(
-                    "id",
-                    th.IntegerType
-                ),
-                th.Property(
-                    "name",
-                    th.StringType
-                )
-            )
-        ),
-        th.Property(
-            "status",
-            th.ObjectType(
-                th.Property(
-                    "id",
-                    th.IntegerType
-                ),
-                th.Property(
-                    "description",
-                    th.StringType
-                )
-            )
-        ),
-        th.Property(
-            "priority",
-            th.ObjectType(
-                th.Property(
-                    "id",
-                    th.IntegerType
-                ),
-                th.Property(
-                    "description",
-                    th.StringType
-                )
-            )
-        ),
-        th.Property(
-            "category",
-            th.ObjectType(
-                th.Property(
-                    "id",
-                    th.IntegerType
-                ),
-                th.Property(
-                    "name",
-                    th.StringType
-                )
-            )
-        ),
-        th.Property(
-            "contactGroup",
-            th.ObjectType(
-                th.Property(
-                    "id",
-                    th.IntegerType
-                ),
-                th.Property(
-                    "name", 
-                    th.StringType
-                )
-            )
-        )
+        th.Property("group", _ID_NAME_OBJECT),
+        th.Property("status", _ID_DESCRIPTION_OBJECT),
+        th.Property("priority", _ID_DESCRIPTION_OBJECT),
+        th.Property("category", _ID_NAME_OBJECT),
+        th.Property("contactGroup", _ID_NAME_OBJECT)
     ).to_dict()
 
@@ -6,7 +6,6 @@ from singer_sdk import Tap, Stream
 from singer_sdk import typing as th  # JSON schema typing helpers
 # TODO: Import your custom stream types here:
 from tap_bolddesk.streams import (
-    BoldDeskStream,
     TicketsStream,
 )
 # TODO: Compile a list of custom stream types here
@@ -39,6 +38,15 @@ class TapBoldDesk(Tap):
             default="2024-01-01",
             description="The earliest creation date of a ticket that shall be collected. You can provide an ISO date or date time, e.g. 2024-01-01 or 2024-01-01T03:00:00Z."
         ),
+        th.Property(
+            "max_parallel_requests",
+            th.IntegerType,
+            default=8,
+            description=(
+                "The maximum number of pages that are requested from the API "
+                "concurrently."
+            )
+        ),
     ).to_dict()
 
     def discover_streams(self) -> List[Stream]:
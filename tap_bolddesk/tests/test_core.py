@@ -1,7 +1,13 @@
 """Tests standard tap features using the built-in SDK tests library."""
 
 import datetime
+import decimal
+import json
+import threading
+import time
+from urllib.parse import parse_qs, urlparse
 
+import requests
 from singer_sdk.testing import get_standard_tap_tests
 
 from tap_bolddesk.tap import TapBoldDesk
@@ -23,4 +29,111 @@ def test_standard_tap_tests():
         test()
 
 
+def _fake_page_response(prepared_request, count, delay=0.0):
+    """Return a page of one ticket whose ID is the requested page number."""
+    time.sleep(delay)
+    query = parse_qs(urlparse(prepared_request.url).query)
+    page = int(query.get("Page", ["1"])[0])
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(
+        {"result": [{"ticketId": page}], "count": count}
+    ).encode()
+    return response
+
+
+def test_request_records_fetches_all_pages():
+    """Request every page announced by the count of the first page."""
+    tap = TapBoldDesk(config={"api_key": "test"}, parse_env_config=False)
+    stream = tap.streams["tickets"]
+
+    def fake_request(prepared_request, context):
+        return _fake_page_response(prepared_request, count=250)
+
+    stream._request = fake_request
+    records = list(stream.request_records(context=None))
+
+    assert [record["ticketId"] for record in records] == [1, 2, 3]
+
+
+def test_request_records_limits_requests_in_flight():
+    """Never run more page requests at once than max_parallel_requests."""
+    tap = TapBoldDesk(
+        config={"api_key": "test", "max_parallel_requests": 3},
+        parse_env_config=False,
+    )
+    stream = tap.streams["tickets"]
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+    started = 0
+
+    def fake_request(prepared_request, context):
+        nonlocal in_flight, peak, started
+        with lock:
+            started += 1
+            in_flight += 1
+            peak = max(peak, in_flight)
+        response = _fake_page_response(prepared_request, count=2000, delay=0.01)
+        with lock:
+            in_flight -= 1
+        return response
+
+    stream._request = fake_request
+    records = stream.request_records(context=None)
+
+    # Consume slowly, so an unbounded producer would run far ahead.
+    ticket_ids = []
+    for record in records:
+        ticket_ids.append(record["ticketId"])
+        with lock:
+            assert started <= record["ticketId"] + 3
+        time.sleep(0.02)
+
+    assert ticket_ids == list(range(1, 21))
+    assert peak <= 3
+
+
+def test_max_parallel_requests_falls_back_and_clamps():
+    """Default a null setting and clamp values below 1."""
+    expected = {None: 8, 0: 1, -1: 1, 5: 5}
+    for value, max_parallel_requests in expected.items():
+        tap = TapBoldDesk(
+            config={"api_key": "test", "max_parallel_requests": value},
+            parse_env_config=False,
+        )
+        stream = tap.streams["tickets"]
+
+        assert stream._max_parallel_requests == max_parallel_requests
+
+
+def test_record_messages_are_valid_singer_json(capsys):
+    """Write RECORD messages as one JSON document per line."""
+    tap = TapBoldDesk(config={"api_key": "test"}, parse_env_config=False)
+    stream = tap.streams["tickets"]
+
+    stream._write_record_message({"ticketId": 1, "title": "Grüße"})
+
+    message = json.loads(capsys.readouterr().out)
+    assert message["type"] == "RECORD"
+    assert message["stream"] == "tickets"
+    assert message["record"] == {"ticketId": 1, "title": "Grüße"}
+
+
+def test_unencodable_record_falls_back_to_sdk_writer(capsys):
+    """Write a record orjson cannot encode exactly once via the SDK writer."""
+    tap = TapBoldDesk(config={"api_key": "test"}, parse_env_config=False)
+    stream = tap.streams["tickets"]
+
+    stream._write_record_message(
+        {"ticketId": 1, "slaBreachedCount": decimal.Decimal("3")}
+    )
+
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 1
+    message = json.loads(lines[0])
+    assert message["type"] == "RECORD"
+    assert message["record"] == {"ticketId": 1, "slaBreachedCount": 3}
+
+
 # TODO: Create additional tests as appropriate for your tap.